@@ -1,8 +1,11 @@
 from GenericRA import ExperimentTemplate
-from typing import Dict, Any
+from typing import Dict, Any, List
 import shutil
 from pathlib import Path
 import os
+import shlex
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 class SAT2024SolverPerformance(ExperimentTemplate):
     def __init__(self, experiment_name: str, benchmark_dir: str):
@@ -17,13 +20,19 @@ class SAT2024SolverPerformance(ExperimentTemplate):
         if not external_path.exists():
             raise FileNotFoundError(f"External benchmark directory not found: {external_benchmark_dir}")
         
-        # Copy all .cnf files from external directory to benchmark directory
-        for cnf_file in external_path.glob("*.cnf"):
-            dest_path = self.benchmark_dir / cnf_file.name
-            shutil.copy2(cnf_file, dest_path)
-            print(f"Copied {cnf_file.name} to benchmark directory")
+        # Collect all .cnf files from external directory
+        with os.scandir(external_path) as entries:
+            pairs = [(entry.path, self.benchmark_dir / entry.name)
+                     for entry in entries
+                     if entry.name.endswith(".cnf") and entry.is_file()]
         
-        print(f"Finished copying CNF files to {self.benchmark_dir}")
+        # Copying is I/O-bound, so overlap the copies across threads
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(lambda pair: shutil.copy2(*pair), pairs))
+        
+        # New formulas invalidate the cached instance list
+        self.__dict__.pop("instances", None)
+        print(f"Finished copying {len(pairs)} CNF files to {self.benchmark_dir}")
         pass
 
     def add_solver(self, solver_name: str, solver_path: str):
@@ -31,6 +40,22 @@ class SAT2024SolverPerformance(ExperimentTemplate):
         self.solver_map[solver_name] = solver_path
         pass
 
+    @functools.cached_property
+    def instances(self) -> List[str]:
+        """Sorted CNF file names in the benchmark directory."""
+        with os.scandir(self.benchmark_dir) as entries:
+            return sorted(entry.name for entry in entries if entry.name.endswith(".cnf"))
+
+    @property
+    def cnf_count(self) -> int:
+        """Number of CNF files in the benchmark directory."""
+        return len(self.instances)
+
+    def write_instance_list(self):
+        """Write the instance names to instances.txt, one per line, for array tasks to index."""
+        with open(self.benchmark_dir / "instances.txt", "w") as f:
+            f.write("".join(f"{name}\n" for name in self.instances))
+
     def submit_slurm_job(self, solver_name: str, solver_path: str):
         assert solver_name in self.solver_map, f"Solver {solver_name} not found"
         assert solver_path == self.solver_map[solver_name], f"Solver {solver_path} not found"
@@ -38,25 +63,62 @@ class SAT2024SolverPerformance(ExperimentTemplate):
         os.makedirs(f"{self.log_dir}/slurm", exist_ok=True)
         slurm_output_file = f"{self.log_dir}/slurm/{solver_name}.slurm.out"
         
-        # Count CNF files to set array size
-        cnf_files = list(self.benchmark_dir.glob("*.cnf"))
-        array_size = len(cnf_files)
-        assert array_size == 400
-        # Create the wrapped command with proper SLURM array handling
-        wrapped = f"#!/bin/bash\n"
-        wrapped += f"instance_path=\"$(ls '{self.benchmark_dir}' | grep '.cnf' | sed -n ${{SLURM_ARRAY_TASK_ID}}p)\"\n"
-        wrapped += f"{solver_path} \"{self.benchmark_dir}/$instance_path\" > {log_file} 2>&1"
-
-        cmd = f"sbatch --mem=6g --array=1-{array_size} --time=01:30:00 --job-name=run_{solver_name} --output={log_file} --wrap=\"{wrapped}\""
+        # Write the instance list so each array task can index it directly
+        array_size = self.cnf_count
+        assert array_size >= 1, f"No CNF files found in {self.benchmark_dir}"
+        self.write_instance_list()
+        # Create the job script with proper SLURM array handling
+        benchmark_dir = shlex.quote(str(self.benchmark_dir))
+        script = f"instance_path=\"$(sed -n \"${{SLURM_ARRAY_TASK_ID}}p\" {benchmark_dir}/instances.txt)\"\n"
+        script += f"{shlex.quote(solver_path)} {benchmark_dir}/\"$instance_path\" > {shlex.quote(log_file)} 2>&1\n"
+        script_path = self.write_job_script(f"run_{solver_name}", script)
+
+        cmd = f"sbatch --mem=6g --array=1-{array_size} --time=01:30:00 --job-name=run_{solver_name} --output={shlex.quote(log_file)} {shlex.quote(str(script_path))}"
         
         print(cmd)
         # os.system(cmd)
 
-    def run(self):
-        """Run the experiment."""
+    def write_job_script(self, job_name: str, body: str) -> Path:
+        """Write a bash job script under log_dir/slurm so sbatch runs it with bash."""
+        script_path = self.log_dir / "slurm" / f"{job_name}.sh"
+        with open(script_path, "w") as f:
+            f.write("#!/bin/bash\n" + body)
+        os.chmod(script_path, 0o755)
+        return script_path
+
+    def write_solver_list(self) -> List[str]:
+        """Write the registered solvers to solvers.txt as "name path" lines."""
+        solver_names = list(self.solver_map)
+        with open(self.output_dir / "solvers.txt", "w") as f:
+            f.write("".join(f"{name} {self.solver_map[name]}\n" for name in solver_names))
+        return solver_names
 
-        for solver_name, solver_path in self.solver_map.items():
-            
+    def submit_all_slurm_jobs(self, max_concurrent: int = 64):
+        """Submit every solver x instance pair as a single throttled SLURM array."""
+        assert self.solver_map, "No solvers registered"
+        os.makedirs(f"{self.log_dir}/slurm", exist_ok=True)
+        slurm_output_file = f"{self.log_dir}/slurm/%A_%a.slurm.out"
+
+        instance_count = self.cnf_count
+        assert instance_count >= 1, f"No CNF files found in {self.benchmark_dir}"
+        self.write_instance_list()
+        total = len(self.write_solver_list()) * instance_count
+
+        # Task i maps to solver (i-1)/instance_count and instance (i-1)%instance_count
+        benchmark_dir = shlex.quote(str(self.benchmark_dir))
+        log_dir = shlex.quote(str(self.log_dir))
+        script = f"solver_idx=$(( (SLURM_ARRAY_TASK_ID-1)/{instance_count} ))\n"
+        script += f"instance_idx=$(( (SLURM_ARRAY_TASK_ID-1)%{instance_count} ))\n"
+        script += f"read -r solver_name solver_path < <(sed -n \"$((solver_idx+1))p\" {shlex.quote(str(self.output_dir))}/solvers.txt)\n"
+        script += f"instance_path=\"$(sed -n \"$((instance_idx+1))p\" {benchmark_dir}/instances.txt)\"\n"
+        script += f"\"$solver_path\" {benchmark_dir}/\"$instance_path\" > {log_dir}/\"${{solver_name}}_${{instance_path%.cnf}}.log\" 2>&1\n"
+        script_path = self.write_job_script(f"run_{self.experiment_name}", script)
+
+        cmd = f"sbatch --mem=6g --array=1-{total}%{max_concurrent} --time=01:30:00 --job-name=run_{self.experiment_name} --open-mode=append --output={shlex.quote(slurm_output_file)} {shlex.quote(str(script_path))}"
 
+        print(cmd)
+        # os.system(cmd)
 
-        pass
\ No newline at end of file
+    def run(self):
+        """Run the experiment."""
+        self.submit_all_slurm_jobs()
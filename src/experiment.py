@@ -1,10 +1,117 @@
+import array
+import atexit
+import hashlib
 import json
 import os
 import pickle
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Encode obj as indented JSON, using orjson when it is installed and can encode obj.
+    
+    orjson writes NaN and infinities as null, where the stdlib encoder writes NaN.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder handles
+            pass
+    return json.dumps(obj, indent=2).encode()
+
+# Buffer size for checkpoint reads/writes
+_IO_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def _atomic_open(filepath: Path) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file for writing that replaces filepath once closed.
+    
+    A crash mid-write leaves only the temporary file behind, never a
+    half-written filepath.
+    """
+    tmp_filepath = filepath.with_name(filepath.name + ".tmp")
+    try:
+        with open(tmp_filepath, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        tmp_filepath.unlink(missing_ok=True)
+        raise
+
+
+class _BatchSizeError(ValueError):
+    """
+    Raised when a *_batch method returns the wrong number of entries.
+    """
+
+
+def _check_batch_size(method_name: str, values: List[Any], expected: int) -> List[Any]:
+    """
+    Check that a *_batch method returned exactly one entry per item.
+    
+    Args:
+        method_name: Name of the batch method, for the error message
+        values: Entries returned by the batch method
+        expected: Number of items passed to the batch method
+        
+    Returns:
+        The entries as a list
+    """
+    values = list(values)
+    if len(values) != expected:
+        raise _BatchSizeError(f"{method_name} returned {len(values)} entries for {expected} items")
+    return values
+
+
+class _ResultsView(Sequence):
+    """
+    Read-only sequence of result entries backed by an experiment's result columns.
+    
+    Each entry is rebuilt on access, so indexing and len() are O(1) and
+    mutation attempts raise instead of silently touching a temporary copy.
+    """
+    
+    def __init__(self, experiment: "ExperimentTemplate"):
+        self._experiment = experiment
+    
+    def __len__(self) -> int:
+        return self._experiment.results_count
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._experiment._result_at(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("result index out of range")
+        return self._experiment._result_at(index)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
 
 
 class ExperimentTemplate(ABC):
@@ -22,7 +129,10 @@ class ExperimentTemplate(ABC):
                  experiment_name: str,
                  output_dir: str = "ExperimentResults",
                  save_interval: int = 1,
-                 auto_save: bool = True):
+                 auto_save: bool = True,
+                 compress: bool = False,
+                 background_save: bool = True,
+                 keep_raw: bool = False):
         """
         Initialize the experiment template.
         
@@ -31,28 +141,50 @@ class ExperimentTemplate(ABC):
             output_dir: Directory to save experiment results
             save_interval: How often to save progress (every N iterations)
             auto_save: Whether to automatically save progress
+            compress: Whether to zstd-compress checkpoint files (requires zstandard); results
+                are kept in the results log, which is always written uncompressed
+            background_save: Whether auto-saves are written from a background thread;
+                pending writes are drained by save(), finish() and at interpreter exit
+            keep_raw: Whether results keep the raw and processed input instead of only an input id
         """
         self.experiment_name = experiment_name
         self.output_dir = Path(output_dir)
         self.save_interval = save_interval
         self.auto_save = auto_save
-        
-        # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if compress and zstandard is None:
+            raise ImportError("zstandard is required for compressed saves (pip install zstandard)")
+        self.compress = compress
+        self.save_suffix = ".pkl.zst" if compress else ".pkl"
+        self.background_save = background_save
+        self.keep_raw = keep_raw
+        self._save_queue = queue.Queue(maxsize=2)
+        self._save_thread = None
+        self._save_error = None
         
         # Experiment state
         self.current_iteration = 0
         self.total_iterations = 0
         self.benchmark_dir = None
         self.log_dir = None
-        self.results = []
+        self._clear_results()
+        # Results are appended to this log as they are produced, so saves
+        # only need to write metadata instead of the whole results list;
+        # reset() moves on to a new generation of the log
+        self.results_log_generation = 0
+        self.results_log_path = self._results_log_path(0)
+        self._results_log_fp = None
+        # Result times are stored as float offsets from this epoch
+        self._t0 = time.time()
         self.metadata = {
             "experiment_name": experiment_name,
-            "start_time": datetime.now().isoformat(),
+            "start_time": datetime.fromtimestamp(self._t0).isoformat(),
+            "start_epoch": self._t0,
             "status": "initialized"
         }
         self.init_logging()
         self.init_benchmark_dir()
+        # Create output, benchmark and log directories if they don't exist
+        self._ensure_dirs()
         # Load existing progress if available
         self._load_progress()
     
@@ -61,7 +193,6 @@ class ExperimentTemplate(ABC):
         Initialize the benchmark directory.
         """
         self.benchmark_dir = Path(self.output_dir / "benchmarks")
-        self.benchmark_dir.mkdir(parents=True, exist_ok=True)
         pass
 
     def init_logging(self):
@@ -69,9 +200,21 @@ class ExperimentTemplate(ABC):
         Initialize logging.
         """
         self.log_dir = Path(self.output_dir / "logs")
-        self.log_dir.mkdir(parents=True, exist_ok=True)
         pass
 
+    def _ensure_dirs(self):
+        """
+        Create the output, benchmark and log directories, skipping any that exist.
+        """
+        for directory in (self.output_dir, self.benchmark_dir, self.log_dir):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                # Missing parent directories, e.g. a nested output_dir
+                os.makedirs(directory, exist_ok=True)
+
     @abstractmethod
     def configure(self, config: Dict[str, Any]) -> Any:
         """
@@ -137,6 +280,352 @@ class ExperimentTemplate(ABC):
         """
         return True
     
+    def validate_batch(self, inputs: List[Any]) -> List[bool]:
+        """
+        Validate a batch of input data. Override this method to validate inputs together.
+        
+        Args:
+            inputs: Input data to validate
+            
+        Returns:
+            One flag per input, True if that input is valid
+        """
+        return [self.validate_input(input_data) for input_data in inputs]
+    
+    def process_batch(self, inputs: List[Any]) -> List[Any]:
+        """
+        Process a batch of input data. Override this method to process inputs together.
+        
+        Args:
+            inputs: Raw input data
+            
+        Returns:
+            Processed input data, one entry per input
+        """
+        return [self.process_input(input_data) for input_data in inputs]
+    
+    def generate_batch(self, processed_inputs: List[Any]) -> List[Any]:
+        """
+        Generate outputs from a batch of processed inputs. Override this method to generate outputs together.
+        
+        Args:
+            processed_inputs: Processed input data
+            
+        Returns:
+            Generated outputs, one entry per processed input
+        """
+        return [self.generate_output(processed_input) for processed_input in processed_inputs]
+    
+    def validate_output_batch(self, outputs: List[Any]) -> List[bool]:
+        """
+        Validate a batch of output data. Override this method to validate outputs together.
+        
+        Args:
+            outputs: Output data to validate
+            
+        Returns:
+            One flag per output, True if that output is valid
+        """
+        return [self.validate_output(output_data) for output_data in outputs]
+    
+    def _clear_results(self) -> None:
+        """
+        Reset the in-memory result columns.
+        
+        Results are stored column-wise rather than as a list of dicts; an
+        error row has no processed input or output and its message is kept
+        in the sparse _errors mapping.
+        """
+        self._iters = array.array('q')
+        self._status = bytearray()  # 0 = success, 1 = error
+        self._t = array.array('d')
+        self._input_ids = []
+        self._inputs = []
+        self._processed_inputs = []
+        self._outputs = []
+        self._errors = {}
+    
+    def _record_result(self, result: Dict[str, Any]) -> None:
+        """
+        Store a result entry in the in-memory result columns.
+        
+        Args:
+            result: Result entry to record
+        """
+        is_error = result.get("status") == "error"
+        if is_error:
+            self._errors[len(self._iters)] = result.get("error")
+        self._iters.append(result["iteration"])
+        self._status.append(is_error)
+        self._t.append(result["t"])
+        self._input_ids.append(result.get("input_id"))
+        self._inputs.append(result.get("input"))
+        self._processed_inputs.append(result.get("processed_input"))
+        self._outputs.append(result.get("output"))
+    
+    def _migrate_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a result entry from a legacy checkpoint to the current format.
+        
+        Args:
+            result: Result entry with an ISO "timestamp" instead of a "t" offset
+            
+        Returns:
+            Result entry with a "t" offset from the experiment start epoch
+        """
+        result = dict(result)
+        if "t" not in result:
+            result["t"] = datetime.fromisoformat(result.pop("timestamp")).timestamp() - self._t0
+        return result
+    
+    def _result_at(self, index: int) -> Dict[str, Any]:
+        """
+        Rebuild the result entry stored at the given row.
+        
+        Args:
+            index: Row index into the result columns
+            
+        Returns:
+            Result entry as produced by run_single
+        """
+        if self._status[index]:
+            return self._make_result(self._iters[index], self._input_ids[index], self._inputs[index],
+                                     self._t[index], error=self._errors[index])
+        return self._make_result(self._iters[index], self._input_ids[index], self._inputs[index],
+                                 self._t[index], processed_input=self._processed_inputs[index],
+                                 output_data=self._outputs[index])
+    
+    def input_id(self, input_data: Any) -> Any:
+        """
+        Get a short identifier for input data. Override this method to use a custom identifier.
+        
+        Uses the input's own id attribute when it has one, otherwise a hash of
+        its repr. Objects with the default repr, which embeds their memory
+        address, are hashed by their pickled state instead so ids are stable
+        across runs.
+        
+        Args:
+            input_data: Raw input data
+            
+        Returns:
+            Identifier for the input
+        """
+        input_id = getattr(input_data, "id", None)
+        if input_id is not None:
+            return input_id
+        if type(input_data).__repr__ is object.__repr__:
+            key = pickle.dumps(input_data, protocol=4)
+        else:
+            key = repr(input_data).encode()
+        return hashlib.blake2b(key, digest_size=8).hexdigest()
+    
+    def _safe_input_id(self, input_data: Any) -> Any:
+        """
+        Get the input id, or None if input_id() raises for this input.
+        
+        Args:
+            input_data: Raw input data
+            
+        Returns:
+            Identifier for the input, or None
+        """
+        try:
+            return self.input_id(input_data)
+        except Exception:
+            return None
+    
+    def _make_result(self,
+                     iteration: int,
+                     input_id: Any,
+                     input_data: Any,
+                     t: float,
+                     processed_input: Any = None,
+                     output_data: Any = None,
+                     error: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build a result entry, keeping raw inputs only if keep_raw is set.
+        
+        Args:
+            iteration: Iteration number of the entry
+            input_id: Identifier of the input, see input_id()
+            input_data: Raw input data
+            t: Seconds since the experiment start epoch
+            processed_input: Processed input data for a success entry
+            output_data: Generated output for a success entry
+            error: Error message for an error entry
+            
+        Returns:
+            Success entry, or error entry if error is given
+        """
+        result = {"iteration": iteration, "input_id": input_id}
+        if self.keep_raw:
+            result["input"] = input_data
+        if error is not None:
+            result["error"] = error
+            result["t"] = t
+            result["status"] = "error"
+            return result
+        if self.keep_raw:
+            result["processed_input"] = processed_input
+        result["output"] = output_data
+        result["t"] = t
+        result["status"] = "success"
+        return result
+    
+    @property
+    def results(self) -> Sequence:
+        """
+        All recorded results as a read-only sequence of result entries.
+        
+        Entries are rebuilt from the result columns when indexed; results can
+        only be added through run_single or run_many, so the sequence has no
+        append and cannot be reassigned.
+        """
+        return _ResultsView(self)
+    
+    @property
+    def results_count(self) -> int:
+        """
+        Number of recorded results.
+        
+        Equal to len(self.results) but reads the result columns directly.
+        """
+        return len(self._iters)
+    
+    def _results_log_path(self, generation: int) -> Path:
+        """
+        Get the path of the results log for a given generation.
+        
+        Args:
+            generation: Log generation, incremented by each reset()
+            
+        Returns:
+            Path to the results log
+        """
+        if generation == 0:
+            return self.output_dir / f"{self.experiment_name}_results.pkl.log"
+        return self.output_dir / f"{self.experiment_name}_results_{generation}.pkl.log"
+    
+    def _latest_results_log_generation(self) -> int:
+        """
+        Find the newest results log generation in the output directory.
+        
+        Returns:
+            Highest generation found, or 0 if there is no results log
+        """
+        prefix = f"{self.experiment_name}_results"
+        suffix = ".pkl.log"
+        latest = 0
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(suffix):
+                    middle = name[len(prefix):-len(suffix)]
+                    if middle[:1] == "_" and middle[1:].isdigit():
+                        latest = max(latest, int(middle[1:]))
+        return latest
+    
+    def _open_results_log(self) -> None:
+        """
+        Open the results log for appending, starting a new log with a header record.
+        
+        The header stores the start epoch so that result times can be mapped
+        back to wall-clock time even if no checkpoint was ever written.
+        """
+        self._results_log_fp = open(self.results_log_path, 'ab', buffering=_IO_BUFFER_SIZE)
+        if self._results_log_fp.tell() == 0:
+            pickle.dump({"start_epoch": self._t0}, self._results_log_fp, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def _set_start_epoch(self, start_epoch: float) -> None:
+        """
+        Set the epoch that result times are measured from.
+        
+        Args:
+            start_epoch: Experiment start as seconds since the Unix epoch
+        """
+        self._t0 = start_epoch
+        self.metadata.update({
+            "start_time": datetime.fromtimestamp(start_epoch).isoformat(),
+            "start_epoch": start_epoch
+        })
+    
+    def _append_result(self, result: Dict[str, Any]) -> None:
+        """
+        Record a result in memory and append it to the on-disk results log.
+        
+        Args:
+            result: Result entry to record
+        """
+        if self._results_log_fp is None:
+            self._open_results_log()
+        pickle.dump(result, self._results_log_fp, protocol=pickle.HIGHEST_PROTOCOL)
+        self._record_result(result)
+    
+    def _append_results(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Record several results in memory and append them to the results log as one record.
+        
+        Args:
+            results: Result entries to record
+        """
+        if self._results_log_fp is None:
+            self._open_results_log()
+        pickle.dump(results, self._results_log_fp, protocol=pickle.HIGHEST_PROTOCOL)
+        for result in results:
+            self._record_result(result)
+    
+    def _close_results_log(self) -> None:
+        """
+        Flush and close the results log if it is open.
+        """
+        if self._results_log_fp is not None:
+            self._results_log_fp.close()
+            self._results_log_fp = None
+    
+    def _replay_results_log(self) -> int:
+        """
+        Load all results recorded in the results log into memory.
+        
+        A record left incomplete by an interrupted write at the end of the
+        log is dropped and truncated so that new results append cleanly.
+        Any other unreadable record raises, leaving the log untouched.
+        The start epoch from the log header replaces the current one.
+        
+        Returns:
+            Number of results replayed
+        """
+        self._clear_results()
+        if not self.results_log_path.exists():
+            return 0
+        
+        with open(self.results_log_path, 'r+b', buffering=_IO_BUFFER_SIZE) as f:
+            offset = 0
+            while True:
+                try:
+                    record = pickle.load(f)
+                    offset = f.tell()
+                except (EOFError, pickle.UnpicklingError) as e:
+                    # A torn write only ever leaves a partial record at the very end
+                    if f.read(1):
+                        raise ValueError(f"Corrupt record at byte {offset} of {self.results_log_path}: {e}") from e
+                    if f.tell() > offset:
+                        print(f"Dropping incomplete record in {self.results_log_path}: {e}")
+                        f.truncate(offset)
+                    break
+                except Exception as e:
+                    raise ValueError(f"Unreadable record at byte {offset} of {self.results_log_path}: {e}") from e
+                
+                if isinstance(record, dict) and "iteration" not in record:
+                    # Log header written by _open_results_log
+                    self._set_start_epoch(record["start_epoch"])
+                elif isinstance(record, list):
+                    # Batch from run_many, logged as a single list record
+                    for result in record:
+                        self._record_result(result)
+                else:
+                    self._record_result(record)
+        return self.results_count
+    
     def run_single(self, input_data: Any) -> Dict[str, Any]:
         """
         Run a single experiment iteration.
@@ -147,6 +636,7 @@ class ExperimentTemplate(ABC):
         Returns:
             Dictionary containing results and metadata
         """
+        input_id = self._safe_input_id(input_data)
         try:
             # Validate input
             if not self.validate_input(input_data):
@@ -163,50 +653,153 @@ class ExperimentTemplate(ABC):
                 raise ValueError("Output validation failed")
             
             # Create result entry
-            result = {
-                "iteration": self.current_iteration,
-                "input": input_data,
-                "processed_input": processed_input,
-                "output": output_data,
-                "timestamp": datetime.now().isoformat(),
-                "status": "success"
-            }
+            result = self._make_result(self.current_iteration, input_id, input_data,
+                                       time.time() - self._t0, processed_input=processed_input,
+                                       output_data=output_data)
             
-            self.results.append(result)
+            self._append_result(result)
             self.current_iteration += 1
             
             # Auto-save if enabled
             if self.auto_save and self.current_iteration % self.save_interval == 0:
-                self.save()
+                self._auto_save()
             
             return result
             
         except Exception as e:
-            error_result = {
-                "iteration": self.current_iteration,
-                "input": input_data,
-                "error": str(e),
-                "timestamp": datetime.now().isoformat(),
-                "status": "error"
-            }
-            self.results.append(error_result)
+            error_result = self._make_result(self.current_iteration, input_id, input_data,
+                                             time.time() - self._t0, error=str(e))
+            self._append_result(error_result)
             self.current_iteration += 1
             return error_result
     
+    def _run_batch_stage(self,
+                         method_name: str,
+                         item_method: Any,
+                         values: Dict[int, Any],
+                         errors: Dict[int, str]) -> Dict[int, Any]:
+        """
+        Run one run_many stage over the inputs that are still in the batch.
+        
+        Args:
+            method_name: Name of the *_batch method for this stage
+            item_method: Per-item method the default *_batch method dispatches to
+            values: Stage inputs keyed by their index in the batch
+            errors: Error messages keyed by batch index, updated with failures
+            
+        Returns:
+            Stage outputs keyed by batch index, for the entries that didn't fail
+        """
+        if not values:
+            return {}
+        
+        if getattr(type(self), method_name) is getattr(ExperimentTemplate, method_name):
+            # Default hook: run per item so one failure doesn't sink the batch
+            results = {}
+            for i, value in values.items():
+                try:
+                    results[i] = item_method(value)
+                except Exception as e:
+                    errors[i] = str(e)
+            return results
+        
+        try:
+            results = _check_batch_size(method_name, getattr(self, method_name)(list(values.values())), len(values))
+        except _BatchSizeError:
+            raise
+        except Exception as e:
+            errors.update((i, str(e)) for i in values)
+            return {}
+        return dict(zip(values, results))
     
-    def save(self, filename: Optional[str] = None) -> str:
+    def run_many(self, inputs: List[Any]) -> List[Dict[str, Any]]:
         """
-        Save the current experiment progress.
+        Run one experiment iteration per input as a single batch.
+        
+        Validation, processing and generation go through the *_batch methods,
+        the batch is logged as one record, and auto-save happens once at the end.
+        Stages left to the default *_batch methods run per item, so an input
+        that fails is recorded as an error on its own, as in run_single. A
+        stage overridden in a subclass runs as a unit: if it raises, every
+        input that reached that stage is recorded as an error.
+        
+        Args:
+            inputs: Input data for the experiment, one entry per iteration
+            
+        Returns:
+            List of dictionaries containing results and metadata
+            
+        Raises:
+            ValueError: If a *_batch method returns the wrong number of entries
+        """
+        inputs = list(inputs)
+        errors: Dict[int, str] = {}
+        
+        # Validate inputs and keep the indices that pass
+        flags = self._run_batch_stage("validate_batch", self.validate_input, dict(enumerate(inputs)), errors)
+        valid = {}
+        for i, ok in flags.items():
+            if ok:
+                valid[i] = inputs[i]
+            else:
+                errors[i] = "Input validation failed"
+        
+        # Process, generate and validate outputs for the inputs still in the batch
+        processed_inputs = self._run_batch_stage("process_batch", self.process_input, valid, errors)
+        outputs = self._run_batch_stage("generate_batch", self.generate_output, processed_inputs, errors)
+        output_flags = self._run_batch_stage("validate_output_batch", self.validate_output, outputs, errors)
+        for i, ok in output_flags.items():
+            if not ok:
+                errors[i] = "Output validation failed"
+        
+        # Create result entries, timed after the work like run_single
+        t = time.time() - self._t0
+        results = []
+        for i, input_data in enumerate(inputs):
+            iteration = self.current_iteration + i
+            input_id = self._safe_input_id(input_data)
+            if i in errors:
+                results.append(self._make_result(iteration, input_id, input_data, t, error=errors[i]))
+            else:
+                results.append(self._make_result(iteration, input_id, input_data, t,
+                                                 processed_input=processed_inputs[i],
+                                                 output_data=outputs[i]))
+        
+        self._append_results(results)
+        self.current_iteration += len(results)
+        
+        # Auto-save once for the whole batch
+        if self.auto_save and results:
+            self._auto_save()
+        
+        return results
+    
+    
+    def result_timestamp(self, result: Dict[str, Any]) -> str:
+        """
+        Get the ISO-formatted wall-clock time at which a result was recorded.
+        
+        Args:
+            result: Result entry from self.results
+            
+        Returns:
+            ISO-formatted timestamp string
+        """
+        return datetime.fromtimestamp(self._t0 + result["t"]).isoformat()
+    
+    def _prepare_save(self, filename: Optional[str] = None) -> Tuple[Path, Dict[str, Any], Dict[str, Any]]:
+        """
+        Update the metadata and snapshot everything a save needs to write.
         
         Args:
             filename: Optional custom filename for the save file
             
         Returns:
-            Path to the saved file
+            Tuple of (save file path, pickle data, JSON summary data)
         """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{self.experiment_name}_progress_{timestamp}.pkl"
+            filename = f"{self.experiment_name}_progress_{timestamp}{self.save_suffix}"
         
         filepath = self.output_dir / filename
         
@@ -214,37 +807,136 @@ class ExperimentTemplate(ABC):
         self.metadata.update({
             "last_save": datetime.now().isoformat(),
             "current_iteration": self.current_iteration,
-            "total_results": len(self.results),
+            "total_results": self.results_count,
             "status": "running"
         })
         
+        # Results live in the append-only log; make sure it is on disk
+        if self._results_log_fp is not None:
+            self._results_log_fp.flush()
+        
+        # Copy the metadata so later updates don't race with a background write
+        metadata = dict(self.metadata)
+        
         # Prepare data to save
         save_data = {
-            "metadata": self.metadata,
-            "results": self.results,
+            "metadata": metadata,
+            "results_log": self.results_log_path.name,
+            "results_log_generation": self.results_log_generation,
             "current_iteration": self.current_iteration,
             "experiment_name": self.experiment_name
         }
-        
-        # Save using pickle for complex objects
-        with open(filepath, 'wb') as f:
-            pickle.dump(save_data, f)
-        
-        # Also save a JSON version for human readability
-        json_filepath = filepath.with_suffix('.json')
         json_data = {
-            "metadata": self.metadata,
+            "metadata": metadata,
             "current_iteration": self.current_iteration,
             "experiment_name": self.experiment_name,
-            "results_count": len(self.results)
+            "results_count": self.results_count
         }
+        return filepath, save_data, json_data
+    
+    def _write_save(self, filepath: Path, save_data: Dict[str, Any], json_data: Dict[str, Any]) -> None:
+        """
+        Write a snapshot produced by _prepare_save to disk.
+        
+        Args:
+            filepath: Path of the save file
+            save_data: Data to pickle into the save file
+            json_data: Summary to write to the JSON sidecar
+        """
+        # Save using pickle for complex objects
+        with _atomic_open(filepath) as f:
+            if filepath.suffix == ".zst":
+                with zstandard.ZstdCompressor(level=3).stream_writer(f, closefd=False) as writer:
+                    pickle.dump(save_data, writer, protocol=pickle.HIGHEST_PROTOCOL)
+            else:
+                pickle.dump(save_data, f, protocol=pickle.HIGHEST_PROTOCOL)
         
-        with open(json_filepath, 'w') as f:
-            json.dump(json_data, f, indent=2)
+        # Also save a JSON version for human readability
+        json_filepath = filepath.with_suffix('') if filepath.suffix == ".zst" else filepath
+        json_filepath = json_filepath.with_suffix('.json')
+        with _atomic_open(json_filepath) as f:
+            f.write(_json_dumps(json_data))
         
         print(f"Progress saved to: {filepath}")
+    
+    def save(self, filename: Optional[str] = None) -> str:
+        """
+        Save the current experiment progress.
+        
+        Args:
+            filename: Optional custom filename for the save file
+            
+        Returns:
+            Path to the saved file
+        """
+        self.wait_for_saves()
+        filepath, save_data, json_data = self._prepare_save(filename)
+        self._write_save(filepath, save_data, json_data)
         return str(filepath)
     
+    def _save_worker(self) -> None:
+        """
+        Write queued save snapshots until a None sentinel is queued.
+        """
+        while True:
+            snapshot = self._save_queue.get()
+            try:
+                if snapshot is None:
+                    return
+                self._write_save(*snapshot)
+            except Exception as e:
+                print(f"Failed to save progress to {snapshot[0]}: {e}")
+                self._save_error = e
+            finally:
+                self._save_queue.task_done()
+    
+    def _stop_save_thread(self) -> None:
+        """
+        Drain queued saves and stop the background save thread.
+        
+        Registered with atexit while the thread runs, so auto-saves queued
+        just before the interpreter exits are still written.
+        """
+        if self._save_thread is not None:
+            self._save_queue.put(None)
+            self._save_thread.join()
+            self._save_thread = None
+            atexit.unregister(self._stop_save_thread)
+        self._raise_save_error()
+    
+    def _raise_save_error(self) -> None:
+        """
+        Re-raise the last error from a background save, if any.
+        """
+        if self._save_error is not None:
+            error, self._save_error = self._save_error, None
+            raise error
+    
+    def _auto_save(self) -> None:
+        """
+        Save progress, handing the write to a background thread if enabled.
+        """
+        if not self.background_save:
+            self.save()
+            return
+        
+        if self._save_thread is None:
+            self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+            self._save_thread.start()
+            atexit.register(self._stop_save_thread)
+        # Blocks only when the writer has fallen a full queue behind
+        self._save_queue.put(self._prepare_save())
+    
+    def wait_for_saves(self) -> None:
+        """
+        Block until all background saves have been written.
+        
+        Raises:
+            Exception: The last error raised by a background save, if any
+        """
+        self._save_queue.join()
+        self._raise_save_error()
+    
     def _load_progress(self) -> bool:
         """
         Load existing progress from saved files.
@@ -252,31 +944,57 @@ class ExperimentTemplate(ABC):
         Returns:
             True if progress was loaded, False otherwise
         """
-        # Look for the most recent save file
-        pattern = f"{self.experiment_name}_progress_*.pkl"
-        save_files = list(self.output_dir.glob(pattern))
-        
-        if not save_files:
-            return False
+        # Look for the most recent save file in a single streaming directory pass
+        prefix = f"{self.experiment_name}_progress_"
+        with os.scandir(self.output_dir) as entries:
+            latest_entry = max((entry for entry in entries
+                                if entry.name.startswith(prefix) and entry.name.endswith(self.save_suffix)),
+                               key=lambda entry: entry.stat().st_mtime, default=None)
         
-        # Get the most recent file
-        latest_file = max(save_files, key=lambda x: x.stat().st_mtime)
+        save_data = None
+        if latest_entry is not None:
+            latest_file = Path(latest_entry.path)
+            try:
+                with open(latest_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                    if latest_file.suffix == ".zst":
+                        with zstandard.ZstdDecompressor().stream_reader(f, closefd=False) as reader:
+                            save_data = pickle.load(reader)
+                    else:
+                        save_data = pickle.load(f)
+            except Exception as e:
+                print(f"Failed to load progress from {latest_file}: {e}")
         
-        try:
-            with open(latest_file, 'rb') as f:
-                save_data = pickle.load(f)
-            
+        if save_data is not None:
             self.metadata = save_data.get("metadata", self.metadata)
-            self.results = save_data.get("results", [])
-            self.current_iteration = save_data.get("current_iteration", 0)
-            
-            print(f"Loaded progress from: {latest_file}")
-            print(f"Resuming from iteration: {self.current_iteration}")
-            return True
-            
-        except Exception as e:
-            print(f"Failed to load progress from {latest_file}: {e}")
-            return False
+            if "start_epoch" in self.metadata:
+                self._t0 = self.metadata["start_epoch"]
+            elif "start_time" in self.metadata:
+                # Checkpoint written before the start epoch was recorded
+                self._set_start_epoch(datetime.fromisoformat(self.metadata["start_time"]).timestamp())
+            # Replay the results log generation this checkpoint was written against
+            self.results_log_generation = save_data.get("results_log_generation", 0)
+            self.results_log_path = self.output_dir / save_data.get(
+                "results_log", self._results_log_path(0).name)
+        else:
+            # Without a checkpoint, resume from the newest results log
+            self.results_log_generation = self._latest_results_log_generation()
+            self.results_log_path = self._results_log_path(self.results_log_generation)
+        
+        # Results are recovered from the log, including any written after the last save
+        self.current_iteration = self._replay_results_log()
+        if save_data is None:
+            return self.current_iteration > 0
+        
+        if save_data.get("results") and not self.results_count:
+            # Checkpoint written before results were logged separately;
+            # move its results into the log so later checkpoints keep them
+            self._append_results([self._migrate_result(result) for result in save_data["results"]])
+            self._results_log_fp.flush()
+        self.current_iteration = max(save_data.get("current_iteration", 0), self.results_count)
+        
+        print(f"Loaded progress from: {latest_file}")
+        print(f"Resuming from iteration: {self.current_iteration}")
+        return True
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -285,16 +1003,17 @@ class ExperimentTemplate(ABC):
         Returns:
             Dictionary containing experiment summary
         """
-        successful_results = [r for r in self.results if r.get("status") == "success"]
-        error_results = [r for r in self.results if r.get("status") == "error"]
+        total_results = self.results_count
+        error_results = self._status.count(1)
+        successful_results = total_results - error_results
         
         return {
             "experiment_name": self.experiment_name,
             "current_iteration": self.current_iteration,
-            "total_results": len(self.results),
-            "successful_results": len(successful_results),
-            "error_results": len(error_results),
-            "success_rate": len(successful_results) / len(self.results) if self.results else 0,
+            "total_results": total_results,
+            "successful_results": successful_results,
+            "error_results": error_results,
+            "success_rate": successful_results / total_results if total_results else 0,
             "start_time": self.metadata.get("start_time"),
             "last_save": self.metadata.get("last_save"),
             "status": self.metadata.get("status", "unknown")
@@ -304,10 +1023,19 @@ class ExperimentTemplate(ABC):
         """
         Reset the experiment state.
         """
+        # Don't let a queued pre-reset checkpoint land after the reset
+        self.wait_for_saves()
         self.current_iteration = 0
-        self.results = []
+        self._clear_results()
+        self._close_results_log()
+        # Start a new log generation; existing checkpoints keep pointing at the old log
+        self.results_log_generation = max(self.results_log_generation,
+                                          self._latest_results_log_generation()) + 1
+        self.results_log_path = self._results_log_path(self.results_log_generation)
+        self._t0 = time.time()
         self.metadata.update({
-            "start_time": datetime.now().isoformat(),
+            "start_time": datetime.fromtimestamp(self._t0).isoformat(),
+            "start_epoch": self._t0,
             "status": "reset"
         })
         print("Experiment state reset")
@@ -321,5 +1049,7 @@ class ExperimentTemplate(ABC):
             "status": "finished",
             "total_iterations": self.current_iteration
         })
-        self.save(f"{self.experiment_name}_final.pkl")
+        self.save(f"{self.experiment_name}_final{self.save_suffix}")
+        self._stop_save_thread()
+        self._close_results_log()
         print("Experiment finished")
\ No newline at end of file
@@ -1,26 +1,24 @@
-import inspect
+import sys
 Showlog = False
-VISIBLE_TAGS=[]
+VISIBLE_TAGS=set()
 
 def TOGGLE_SHOWLOG(on):
     global Showlog
     Showlog = on
 
 def REG_TAG(tag):
-    VISIBLE_TAGS.append(tag)
+    VISIBLE_TAGS.add(tag)
 
 def sourced_print(message, source):
-    for line in message.split("\n"):
-        print(f"[{source}] {line}")
+    prefix = f"[{source}] "
+    sys.stdout.write(prefix + message.replace("\n", "\n" + prefix) + "\n")
 
 def LOG(message):
-    caller = inspect.currentframe().f_back
-    source = caller.f_code.co_name if caller else ""
-    if Showlog:
-        sourced_print(message, source)
+    if not Showlog:
+        return
+    sourced_print(message, sys._getframe(1).f_code.co_name)
         
 def LOG_TAG(message,tag):
-    caller = inspect.currentframe().f_back
-    source = caller.f_code.co_name if caller else ""
-    if Showlog and tag in VISIBLE_TAGS:
-        sourced_print(message, source)
\ No newline at end of file
+    if not Showlog or tag not in VISIBLE_TAGS:
+        return
+    sourced_print(message, sys._getframe(1).f_code.co_name)